@@ -3,21 +3,35 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
-from dotenv import load_dotenv
+from dotenv.main import DotEnv
 
 # Root of the repository (the directory containing this file is tamaos/)
 ROOT_DIR = Path(__file__).resolve().parents[1]
 ENV_FILE = ROOT_DIR / ".env"
 
-# Load .env variables if present. Values injected via the environment take precedence.
-load_dotenv(dotenv_path=ENV_FILE, override=False)
 
+@lru_cache(maxsize=1)
+def _env_snapshot() -> Mapping[str, str]:
+    """Return the merged .env and process environment, parsed once.
 
-def _get_int(name: str, default: int) -> int:
-    value = os.getenv(name)
+    Values injected via the environment take precedence over the .env file.
+    """
+
+    # override=False resolves ${VAR} references against the process environment first,
+    # matching load_dotenv(override=False).
+    file_values = DotEnv(ENV_FILE, interpolate=True, override=False).dict()
+    merged = {key: value for key, value in file_values.items() if value is not None}
+    merged.update(os.environ)
+    return MappingProxyType(merged)
+
+
+def _get_int(env: Mapping[str, str], name: str, default: int) -> int:
+    value = env.get(name)
     if value is None or value.strip() == "":
         return default
     try:
@@ -26,8 +40,8 @@ def _get_int(name: str, default: int) -> int:
         return default
 
 
-def _get_path(name: str, default: Path) -> Path:
-    value = os.getenv(name)
+def _get_path(env: Mapping[str, str], name: str, default: Path) -> Path:
+    value = env.get(name)
     if value is None or value.strip() == "":
         return default
     expanded = Path(value).expanduser()
@@ -37,13 +51,13 @@ def _get_path(name: str, default: Path) -> Path:
         return expanded
 
 
-def _get_str(name: str, default: str) -> str:
-    value = os.getenv(name)
+def _get_str(env: Mapping[str, str], name: str, default: str) -> str:
+    value = env.get(name)
     return value if value not in (None, "") else default
 
 
-def _get_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
+def _get_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    value = env.get(name)
     if value is None:
         return default
     normalized = value.strip().lower()
@@ -94,15 +108,16 @@ class Settings:
 _century_default = 100 * 365 * 24 * 60 * 60
 _default_vfs = (ROOT_DIR / "vfs").resolve()
 _default_logs = (ROOT_DIR / "logs").resolve()
+_env = _env_snapshot()
 
 settings = Settings(
     root_dir=ROOT_DIR,
     env_file=ENV_FILE,
-    century_real_seconds=_get_int("CENTURY_REAL_SEC", _century_default),
-    vfs_path=_get_path("VFS_PATH", _default_vfs),
-    log_path=_get_path("LOG_PATH", _default_logs),
-    tamaos_name=_get_str("TAMAOS_NAME", "TamaOS"),
-    log_level=_get_str("LOG_LEVEL", "INFO"),
-    ui_skin=_get_str("TAMAOS_UI_SKIN", "classic").lower(),
-    animate_ui=_get_bool("TAMAOS_ANIMATE_UI", True),
+    century_real_seconds=_get_int(_env, "CENTURY_REAL_SEC", _century_default),
+    vfs_path=_get_path(_env, "VFS_PATH", _default_vfs),
+    log_path=_get_path(_env, "LOG_PATH", _default_logs),
+    tamaos_name=_get_str(_env, "TAMAOS_NAME", "TamaOS"),
+    log_level=_get_str(_env, "LOG_LEVEL", "INFO"),
+    ui_skin=_get_str(_env, "TAMAOS_UI_SKIN", "classic").lower(),
+    animate_ui=_get_bool(_env, "TAMAOS_ANIMATE_UI", True),
 )
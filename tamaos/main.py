@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from textwrap import dedent
+from typing import Callable
 
 from .skins import SkinManager
 
@@ -40,49 +41,70 @@ def _print_banner() -> None:
     print(skin_manager.render_banner(_banner_content()))
 
 
-def _handle_skin_command(parts: list[str]) -> None:
-    if not parts or parts[0].lower() in {"help", "?"}:
-        print("Usage: skin list | skin use <name> | skin show | skin animate <on|off>")
-        return
+_SKIN_USAGE = "Usage: skin list | skin use <name> | skin show | skin animate <on|off>"
 
-    action = parts[0].lower()
-    if action == "list":
-        for skin in skin_manager.list_skins():
-            marker = "*" if skin.name == skin_manager.current_name else "-"
-            print(f"{marker} {skin.name:<10} : {skin.display_name} — {skin.description}")
-        return
 
-    if action in {"use", "set"}:
-        if len(parts) < 2:
-            print("Usage: skin use <name>")
-            return
-        target = parts[1]
-        if skin_manager.set_skin(target):
-            print(f"Skin set to '{skin_manager.current_name}'.")
-            _print_banner()
-        else:
-            available = ", ".join(sorted(s.name for s in skin_manager.list_skins()))
-            print(f"Unknown skin '{target}'. Available skins: {available}")
-        return
+def _skin_list(args: list[str]) -> None:
+    for skin in skin_manager.list_skins():
+        marker = "*" if skin.name == skin_manager.current_name else "-"
+        print(f"{marker} {skin.name:<10} : {skin.display_name} — {skin.description}")
+
 
-    if action == "show":
+def _skin_use(args: list[str]) -> None:
+    if not args:
+        print("Usage: skin use <name>")
+        return
+    target = args[0]
+    if skin_manager.set_skin(target):
+        print(f"Skin set to '{skin_manager.current_name}'.")
         _print_banner()
+    else:
+        available = ", ".join(sorted(s.name for s in skin_manager.list_skins()))
+        print(f"Unknown skin '{target}'. Available skins: {available}")
+
+
+def _skin_show(args: list[str]) -> None:
+    _print_banner()
+
+
+def _skin_animate(args: list[str]) -> None:
+    if not args:
+        status = "on" if skin_manager.animation_enabled() else "off"
+        print(f"Animation is currently {status}. Use 'skin animate on' or 'skin animate off'.")
+        return
+    toggle = args[0].lower()
+    if toggle not in {"on", "off"}:
+        print("Usage: skin animate <on|off>")
         return
+    skin_manager.set_animation(toggle == "on")
+    print(f"Animation {'enabled' if toggle == 'on' else 'disabled'}.")
+
+
+_SKIN_ACTIONS: dict[str, Callable[[list[str]], None]] = {
+    "list": _skin_list,
+    "use": _skin_use,
+    "set": _skin_use,
+    "show": _skin_show,
+    "animate": _skin_animate,
+}
+
 
-    if action == "animate":
-        if len(parts) < 2:
-            status = "on" if skin_manager.animation_enabled() else "off"
-            print(f"Animation is currently {status}. Use 'skin animate on' or 'skin animate off'.")
-            return
-        toggle = parts[1].lower()
-        if toggle not in {"on", "off"}:
-            print("Usage: skin animate <on|off>")
-            return
-        skin_manager.set_animation(toggle == "on")
-        print(f"Animation {'enabled' if toggle == 'on' else 'disabled'}.")
+def _handle_skin_command(parts: list[str]) -> None:
+    action = _SKIN_ACTIONS.get(parts[0].lower()) if parts else None
+    if action is None:
+        print(_SKIN_USAGE)
         return
+    action(parts[1:])
+
+
+def _handle_status_command(parts: list[str]) -> None:
+    print(settings.summary())
 
-    print("Usage: skin list | skin use <name> | skin show | skin animate <on|off>")
+
+_COMMANDS: dict[str, Callable[[list[str]], None]] = {
+    "status": _handle_status_command,
+    "skin": _handle_skin_command,
+}
 
 
 def repl() -> None:
@@ -105,13 +127,11 @@ def repl() -> None:
         lowered = parts[0].lower()
         if lowered in {"exit", "quit"}:
             break
-        if lowered == "status":
-            print(settings.summary())
-            continue
-        if lowered == "skin":
-            _handle_skin_command(parts[1:])
+        handler = _COMMANDS.get(lowered)
+        if handler is None:
+            print(f"Unknown command: {command}")
             continue
-        print(f"Unknown command: {command}")
+        handler(parts[1:])
 
     print("Exiting TamaOS shell. Goodbye!")
 
@@ -1,6 +1,9 @@
 """UI skins and playful animations for the TamaOS shell."""
 from __future__ import annotations
 
+import codecs
+import functools
+import os
 import sys
 import time
 from dataclasses import dataclass
@@ -26,9 +29,33 @@ class Skin:
     title_lines: Sequence[str] = ()
     animation_frames: Sequence[str] = ()
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_pad", " " * self.padding)
+        frame_width = max((len(frame) for frame in self.animation_frames), default=0)
+        object.__setattr__(
+            self,
+            "_animation_cache",
+            tuple("\r" + frame.ljust(frame_width) for frame in self.animation_frames),
+        )
+        object.__setattr__(self, "_animation_clear", "\r" + " " * frame_width + "\r")
+        # Skins are immutable, so a rendered banner never goes stale.
+        object.__setattr__(self, "_render_cached", functools.lru_cache(maxsize=32)(self._render_impl))
+        object.__setattr__(self, "_render_bytes_cached", functools.lru_cache(maxsize=32)(self._encode_render))
+
     def render(self, content: str) -> str:
         """Render the provided content inside the skin's decorative frame."""
 
+        return self._render_cached(content)
+
+    def render_bytes(self, content: str) -> bytes:
+        """Return :meth:`render` output plus a trailing newline, pre-encoded as UTF-8."""
+
+        return self._render_bytes_cached(content)
+
+    def _encode_render(self, content: str) -> bytes:
+        return (self.render(content) + "\n").encode("utf-8")
+
+    def _render_impl(self, content: str) -> str:
         lines = content.splitlines() or [""]
         width = max(len(line) for line in lines)
         inner_width = width + self.padding * 2
@@ -36,10 +63,8 @@ class Skin:
         top = f"{self.top_left}{horizontal_line}{self.top_right}"
         bottom = f"{self.bottom_left}{horizontal_line}{self.bottom_right}"
 
-        padded_lines = [
-            f"{self.vertical}{' ' * self.padding}{line.ljust(width)}{' ' * self.padding}{self.vertical}"
-            for line in lines
-        ]
+        pad = self._pad
+        padded_lines = [f"{self.vertical}{pad}{line.ljust(width)}{pad}{self.vertical}" for line in lines]
 
         banner_lines = []
         if self.title_lines:
@@ -58,22 +83,35 @@ class Skin:
     def animate(self, stream, repeat: int = 2, delay: float = 0.12) -> None:
         """Play the skin's animation frames on the provided stream."""
 
-        if not self.animation_frames:
+        frames = self._animation_cache
+        if not frames:
             return
-        frames = list(self.animation_frames)
-        width = max(len(frame) for frame in frames)
+        # Sleep until fixed deadlines so write/flush time does not accumulate as drift.
+        deadline = time.monotonic()
         for _ in range(repeat):
             for frame in frames:
-                stream.write("\r" + frame.ljust(width))
+                stream.write(frame)
                 stream.flush()
-                time.sleep(delay)
-        stream.write("\r" + " " * width + "\r")
+                deadline += delay
+                time.sleep(max(0.0, deadline - time.monotonic()))
+        stream.write(self._animation_clear)
         stream.flush()
 
 
+def _is_utf8(encoding: str | None) -> bool:
+    if not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
 class SkinManager:
     """Utility for working with the available UI skins."""
 
+    __slots__ = ("_skins", "_current_name", "_animate", "_stream")
+
     def __init__(self, default_skin: str = DEFAULT_SKIN_NAME, animate: bool = True, stream=None) -> None:
         self._skins: Dict[str, Skin] = {skin.name: skin for skin in _BUILTIN_SKINS}
         normalized = default_skin.lower()
@@ -105,7 +143,24 @@ class SkinManager:
     def play_intro(self, content: str) -> None:
         if self._should_animate():
             self.current_skin.animate(self._stream)
-        print(self.render_banner(content), file=self._stream)
+        self._write_banner(content)
+
+    def _write_banner(self, content: str) -> None:
+        stream = self._stream
+        buffer = getattr(stream, "buffer", None)
+        # Only bypass the text layer when it would encode, handle errors and translate
+        # newlines exactly as a strict UTF-8 encode does.
+        if (
+            buffer is None
+            or os.linesep != "\n"
+            or not _is_utf8(getattr(stream, "encoding", None))
+            or getattr(stream, "errors", "strict") != "strict"
+        ):
+            print(self.render_banner(content), file=stream)
+            return
+        stream.flush()
+        buffer.write(self.current_skin.render_bytes(content))
+        buffer.flush()
 
     def animation_enabled(self) -> bool:
         return self._animate
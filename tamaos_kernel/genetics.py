@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import random
 import secrets
 from dataclasses import dataclass
@@ -12,7 +13,16 @@ DEFAULT_GENOME_LENGTH = 32
 # Serialization helpers -----------------------------------------------------
 
 BASE60_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwx"
-_BASE60_LOOKUP = {ch: idx for idx, ch in enumerate(BASE60_ALPHABET)}
+_BASE60_INVALID = 0xFF
+# bytes.translate table mapping each ASCII code to its digit value (0xFF if invalid).
+_BASE60_TABLE = bytes(
+    BASE60_ALPHABET.find(chr(code)) if chr(code) in BASE60_ALPHABET else _BASE60_INVALID
+    for code in range(256)
+)
+_BASE60_BYTES = BASE60_ALPHABET.encode("ascii")
+# Peel digits off the bigint ten at a time; 60**10 still fits in 64 bits.
+_BASE60_CHUNK_DIGITS = 10
+_BASE60_CHUNK = 60**_BASE60_CHUNK_DIGITS
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,9 +38,18 @@ class Genome:
             raise TypeError("seed must be an integer or None")
 
     @classmethod
-    def from_seed(cls, seed: int, *, length: int = DEFAULT_GENOME_LENGTH) -> "Genome":
+    def from_seed(cls, seed: int, *, length: int = DEFAULT_GENOME_LENGTH, legacy: bool = False) -> "Genome":
+        """Derive genome bytes from ``seed``.
+
+        ``legacy=True`` reproduces the per-byte ``randrange`` stream used by
+        earlier releases, for regenerating genomes recorded by seed alone.
+        """
+
         rng = random.Random(seed)
-        data = bytes(rng.randrange(0, 256) for _ in range(length))
+        if legacy:
+            data = bytes(rng.randrange(0, 256) for _ in range(length))
+        else:
+            data = rng.randbytes(length)
         return cls(bytes_=data, seed=seed)
 
     @classmethod
@@ -44,13 +63,13 @@ class Genome:
 def to_base64(g: Genome) -> str:
     """Encode genome bytes into base64 for transport."""
 
-    return base64.b64encode(g.bytes_).decode("ascii")
+    return binascii.b2a_base64(g.bytes_, newline=False).decode("ascii")
 
 
 def from_base64(text: str, *, seed: int | None = None) -> Genome:
     """Reconstruct a genome from a base64 payload."""
 
-    return Genome(bytes_=base64.b64decode(text.encode("ascii")), seed=seed)
+    return Genome(bytes_=base64.b64decode(text), seed=seed)
 
 
 def to_dict(g: Genome) -> dict[str, Any]:
@@ -62,7 +81,7 @@ def to_dict(g: Genome) -> dict[str, Any]:
     return payload
 
 
-def _base60_length(byte_len: int) -> int:
+def _compute_base60_length(byte_len: int) -> int:
     if byte_len == 0:
         return 1
     max_value = (1 << (byte_len * 8)) - 1
@@ -74,6 +93,31 @@ def _base60_length(byte_len: int) -> int:
     return digits
 
 
+def _build_base60_widths(limit: int) -> tuple[int, ...]:
+    widths = [1]
+    digits = 1
+    threshold = 60
+    for byte_len in range(1, limit):
+        max_value = (1 << (byte_len * 8)) - 1
+        while max_value >= threshold:
+            digits += 1
+            threshold *= 60
+        widths.append(digits)
+    return tuple(widths)
+
+
+# Encoded widths depend only on the byte length, so tabulate the common range once.
+_BASE60_WIDTH_TABLE_SIZE = 1024
+_WIDTH_FOR_BYTES = _build_base60_widths(_BASE60_WIDTH_TABLE_SIZE)
+_BYTES_FOR_WIDTH = {width: byte_len for byte_len, width in enumerate(_WIDTH_FOR_BYTES)}
+
+
+def _base60_length(byte_len: int) -> int:
+    if byte_len < _BASE60_WIDTH_TABLE_SIZE:
+        return _WIDTH_FOR_BYTES[byte_len]
+    return _compute_base60_length(byte_len)
+
+
 def to_base60(g: Genome) -> str:
     """Encode genome bytes into a base-60 string with deterministic padding."""
 
@@ -82,20 +126,28 @@ def to_base60(g: Genome) -> str:
         return BASE60_ALPHABET[0] * width
 
     value = int.from_bytes(g.bytes_, byteorder="big")
-    digits: list[str] = []
+    out = bytearray(_BASE60_BYTES[:1] * width)
+    end = width
     while value:
-        value, remainder = divmod(value, 60)
-        digits.append(BASE60_ALPHABET[remainder])
-    encoded = "".join(reversed(digits or [BASE60_ALPHABET[0]]))
-    return encoded.rjust(width, BASE60_ALPHABET[0])
+        value, chunk = divmod(value, _BASE60_CHUNK)
+        pos = end
+        while chunk:
+            chunk, remainder = divmod(chunk, 60)
+            pos -= 1
+            out[pos] = _BASE60_BYTES[remainder]
+        end -= _BASE60_CHUNK_DIGITS
+    return out.decode("ascii")
 
 
 def _byte_length_for_base60_length(length: int) -> int:
     if length < 1:
         raise ValueError("base-60 text must contain at least one character")
-    if length == 1:
-        return 0
-    byte_len = 1
+    byte_len = _BYTES_FOR_WIDTH.get(length)
+    if byte_len is not None:
+        return byte_len
+    if length <= _WIDTH_FOR_BYTES[-1]:
+        raise ValueError("invalid base-60 length for genome encoding")
+    byte_len = _BASE60_WIDTH_TABLE_SIZE
     while True:
         candidate = _base60_length(byte_len)
         if candidate == length:
@@ -110,13 +162,21 @@ def from_base60(text: str, *, seed: int | None = None) -> Genome:
 
     if not text:
         raise ValueError("base-60 text must not be empty")
+    try:
+        digits = text.encode("ascii").translate(_BASE60_TABLE)
+    except UnicodeEncodeError as exc:
+        raise ValueError(f"invalid base-60 digit: {text[exc.start]!r}") from exc
+    invalid = digits.find(_BASE60_INVALID)
+    if invalid != -1:
+        raise ValueError(f"invalid base-60 digit: {text[invalid]!r}")
     value = 0
-    for char in text:
-        try:
-            digit = _BASE60_LOOKUP[char]
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise ValueError(f"invalid base-60 digit: {char!r}") from exc
-        value = value * 60 + digit
+    for start in range(0, len(digits), _BASE60_CHUNK_DIGITS):
+        chunk = digits[start : start + _BASE60_CHUNK_DIGITS]
+        chunk_value = 0
+        for digit in chunk:
+            chunk_value = chunk_value * 60 + digit
+        scale = _BASE60_CHUNK if len(chunk) == _BASE60_CHUNK_DIGITS else 60 ** len(chunk)
+        value = value * scale + chunk_value
     byte_len = _byte_length_for_base60_length(len(text))
     if byte_len == 0:
         return Genome(bytes_=b"", seed=seed)
@@ -0,0 +1,58 @@
+"""Tests for the configuration environment snapshot."""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tamaos import config
+
+
+@pytest.fixture
+def env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / ".env"
+    monkeypatch.setattr(config, "ENV_FILE", path)
+    config._env_snapshot.cache_clear()
+    yield path
+    config._env_snapshot.cache_clear()
+
+
+def test_environment_overrides_env_file(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file.write_text("TAMAOS_NAME=FromFile\nLOG_LEVEL=WARN\n", encoding="utf-8")
+    monkeypatch.setenv("TAMAOS_NAME", "FromEnv")
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+
+    env = config._env_snapshot()
+
+    assert config._get_str(env, "TAMAOS_NAME", "TamaOS") == "FromEnv"
+    assert config._get_str(env, "LOG_LEVEL", "INFO") == "WARN"
+
+
+def test_empty_or_missing_values_fall_back_to_defaults(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file.write_text("CENTURY_REAL_SEC=\nTAMAOS_ANIMATE_UI=\n", encoding="utf-8")
+    monkeypatch.setenv("TAMAOS_UI_SKIN", "")
+    monkeypatch.delenv("CENTURY_REAL_SEC", raising=False)
+    monkeypatch.delenv("TAMAOS_ANIMATE_UI", raising=False)
+    monkeypatch.delenv("VFS_PATH", raising=False)
+
+    env = config._env_snapshot()
+
+    assert config._get_int(env, "CENTURY_REAL_SEC", 42) == 42
+    assert config._get_bool(env, "TAMAOS_ANIMATE_UI", True) is True
+    assert config._get_str(env, "TAMAOS_UI_SKIN", "classic") == "classic"
+    assert config._get_path(env, "VFS_PATH", Path("/default")) == Path("/default")
+
+
+def test_env_file_interpolation_prefers_environment(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file.write_text("BASE=/file\nVFS_PATH=${BASE}/vfs\n", encoding="utf-8")
+    monkeypatch.setenv("BASE", "/env")
+    monkeypatch.delenv("VFS_PATH", raising=False)
+
+    env = config._env_snapshot()
+
+    assert env["VFS_PATH"] == "/env/vfs"
+    assert env["BASE"] == "/env"
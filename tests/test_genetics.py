@@ -1,13 +1,17 @@
 """Tests for the genome encoding helpers."""
 
+import base64
 from pathlib import Path
+import random
 import sys
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from tamaos_kernel.genetics import Genome, from_base60, to_base60
+from tamaos_kernel.genetics import BASE60_ALPHABET, Genome, from_base60, from_dict, to_base60, to_dict
 
 
 def test_base60_round_trip_deterministic() -> None:
@@ -22,3 +26,34 @@ def test_base60_round_trip_deterministic() -> None:
     assert len(lengths) == 1, "all encodings should have the same width for fixed genome size"
 
     assert len(set(encoded)) == len(encoded), "different seeds should yield unique encodings"
+
+
+def test_base60_encoding_matches_integer_value() -> None:
+    for length in (0, 1, 7, 8, 9, 32, 64):
+        genome = Genome.from_seed(length, length=length)
+        encoded = to_base60(genome)
+        value = 0
+        for char in encoded:
+            value = value * 60 + BASE60_ALPHABET.index(char)
+        assert value == int.from_bytes(genome.bytes_, byteorder="big")
+
+
+@pytest.mark.parametrize("text", ["12y", "1 2", "\u00e41"])
+def test_from_base60_rejects_invalid_digits(text: str) -> None:
+    with pytest.raises(ValueError, match="invalid base-60 digit"):
+        from_base60(text)
+
+
+def test_from_seed_legacy_stream_is_preserved() -> None:
+    rng = random.Random(7)
+    expected = bytes(rng.randrange(0, 256) for _ in range(16))
+    assert Genome.from_seed(7, length=16, legacy=True).bytes_ == expected
+    assert Genome.from_seed(7, length=16).bytes_ == random.Random(7).randbytes(16)
+
+
+def test_dict_round_trip_preserves_bytes_and_seed() -> None:
+    genome = Genome.from_seed(11, length=13)
+    payload = to_dict(genome)
+    assert payload == {"bytes": base64.b64encode(genome.bytes_).decode("ascii"), "seed": 11}
+    restored = from_dict(payload)
+    assert restored == genome
@@ -0,0 +1,90 @@
+"""Tests for the shell skins."""
+
+import contextlib
+import io
+from pathlib import Path
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tamaos import skins
+from tamaos.skins import SkinManager
+
+CONTENT = "hello\nlattice"
+
+
+@pytest.mark.parametrize("name", ["classic", "synthwave", "aurora"])
+def test_animate_writes_padded_frames_then_clears(name: str) -> None:
+    skin = SkinManager(default_skin=name).current_skin
+    frames = list(skin.animation_frames)
+    width = max(len(frame) for frame in frames)
+    expected = "".join("\r" + frame.ljust(width) for frame in frames) * 2 + "\r" + " " * width + "\r"
+
+    stream = io.StringIO()
+    skin.animate(stream, repeat=2, delay=0)
+
+    assert stream.getvalue() == expected
+
+
+def test_intro_writes_bytes_directly_on_utf8_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(skins.os, "linesep", "\n")
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    manager = SkinManager(default_skin="aurora", animate=False, stream=stream)
+
+    stream.write("before\n")
+    manager.play_intro(CONTENT)
+    stream.write("after\n")
+    stream.flush()
+
+    banner = manager.render_banner(CONTENT)
+    assert raw.getvalue() == ("before\n" + banner + "\nafter\n").encode("utf-8")
+
+
+def test_intro_honours_stream_error_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(skins.os, "linesep", "\n")
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", errors="surrogateescape")
+    manager = SkinManager(default_skin="aurora", animate=False, stream=stream)
+    content = "caf\udce9"
+
+    manager.play_intro(content)
+    stream.flush()
+
+    banner = manager.render_banner(content)
+    assert raw.getvalue() == (banner + "\n").encode("utf-8", errors="surrogateescape")
+
+
+def test_intro_uses_text_layer_on_non_utf8_stream() -> None:
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="latin-1", errors="replace")
+    manager = SkinManager(default_skin="aurora", animate=False, stream=stream)
+
+    manager.play_intro(CONTENT)
+    stream.flush()
+
+    banner = manager.render_banner(CONTENT)
+    assert raw.getvalue() == (banner + "\n").encode("latin-1", errors="replace")
+
+
+def test_intro_prints_to_bufferless_stream() -> None:
+    stream = io.StringIO()
+    manager = SkinManager(default_skin="aurora", animate=False, stream=stream)
+
+    manager.play_intro(CONTENT)
+
+    assert stream.getvalue() == manager.render_banner(CONTENT) + "\n"
+
+
+def test_shell_banner_follows_redirected_stdout() -> None:
+    from tamaos import main
+
+    captured = io.StringIO()
+    with contextlib.redirect_stdout(captured):
+        main._print_banner()
+
+    assert captured.getvalue() == main.skin_manager.render_banner(main._banner_content()) + "\n"